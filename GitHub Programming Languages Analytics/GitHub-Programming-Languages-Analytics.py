@@ -1,68 +1,405 @@
-from preswald import connect, get_df, query, table, text, plotly, matplotlib
+from preswald import connect, get_df, table, text, plotly, matplotlib, selectbox
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+from forecasting import (
+    FORECAST_INTERVAL_Z,
+    FORECAST_PARAMETERS,
+    active_series,
+    build_quarterly_matrix,
+    fit_holt_batch,
+    forecast_counts,
+    last_complete_period,
+    period_label,
+    trim_incomplete_periods
+)
+
+QUERY_CACHE_TTL_SECONDS = 300
+QUERY_CACHE_MAX_ENTRIES = 64
+QUERY_CACHE_MODULE = "_github_lang_analytics_query_cache"
+
+
+def get_query_cache():
+    cache = sys.modules.get(QUERY_CACHE_MODULE)
+    if cache is None:
+        cache = types.ModuleType(QUERY_CACHE_MODULE)
+        cache.lock = threading.Lock()
+        cache.entries = OrderedDict()
+        cache.inflight = {}
+        cache.hits = 0
+        cache.misses = 0
+        cache = sys.modules.setdefault(QUERY_CACHE_MODULE, cache)
+    return cache
+
+
+def load_preswald_config(config_path="preswald.toml"):
+    if tomllib is None:
+        raise ImportError("Reading preswald.toml needs Python 3.11+ or the tomli package (pip install tomli)")
+    try:
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def source_version(sources):
+    version = []
+    for source in sources:
+        path = SOURCE_PATHS.get(source)
+        try:
+            stat = os.stat(path)
+            version.append((source, stat.st_mtime_ns, stat.st_size))
+        except (OSError, TypeError):
+            version.append((source, None, None))
+    return tuple(version)
+
+
+def copy_result(value):
+    if isinstance(value, tuple):
+        return tuple(copy_result(item) for item in value)
+    return value.copy() if hasattr(value, "copy") else value
+
+
+def cached_result(key, compute, ttl=QUERY_CACHE_TTL_SECONDS, max_entries=QUERY_CACHE_MAX_ENTRIES):
+    if not QUERY_CACHE_ENABLED:
+        return compute()
+    cache = get_query_cache()
+    with cache.lock:
+        entry = cache.entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            cache.entries.move_to_end(key)
+            cache.hits += 1
+            return copy_result(entry[1])
+        flight = cache.inflight.get(key)
+        is_leader = flight is None
+        if is_leader:
+            flight = {"done": threading.Event(), "value": None, "error": None}
+            cache.inflight[key] = flight
+            cache.misses += 1
+        else:
+            cache.hits += 1
+
+    if not is_leader:
+        flight["done"].wait()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return copy_result(flight["value"])
+
+    try:
+        flight["value"] = compute()
+    except Exception as e:
+        flight["error"] = e
+        raise
+    finally:
+        with cache.lock:
+            if flight["error"] is None and flight["value"] is not None:
+                cache.entries[key] = (time.monotonic() + ttl, flight["value"])
+                cache.entries.move_to_end(key)
+                while len(cache.entries) > max_entries:
+                    cache.entries.popitem(last=False)
+            del cache.inflight[key]
+        flight["done"].set()
+    return copy_result(flight["value"])
+
+
+def cached_stage(name, sources, compute, params=()):
+    key = ("stage", name, params, source_version(sources))
+    return cached_result(key, compute)
+
+
+PRESWALD_CONFIG = load_preswald_config()
+SOURCE_PATHS = {alias: source.get("path") for alias, source in PRESWALD_CONFIG.get("data", {}).items()}
+QUERY_CACHE_ENABLED = PRESWALD_CONFIG.get("performance", {}).get("cache_enabled", True)
+
+VALIDATION_CHUNK_ROWS = 100000
+VALID_YEAR_MIN = 2008
+QUARANTINE_PATH = os.path.join("data", "quarantine.csv")
+VALIDATION_SPECS = {
+    "issues_csv": {"name_column": "name", "count_column": "count", "period_columns": ["year", "quarter"]},
+    "prs_csv": {"name_column": "name", "count_column": "count", "period_columns": ["year", "quarter"]},
+    "repos_csv": {"name_column": "language", "count_column": "num_repos", "period_columns": []}
+}
+
+
+def validate_chunk(chunk, spec, seen_keys, seen_spellings):
+    name_column, count_column, period_columns = spec["name_column"], spec["count_column"], spec["period_columns"]
+    raw_names = chunk[name_column].astype("string")
+    names = raw_names.str.strip()
+    counts = pd.to_numeric(chunk[count_column], errors="coerce")
+    checks = [
+        ("missing_name", (names.isna() | (names == "")).fillna(True).to_numpy(dtype=bool)),
+        ("invalid_count", (counts.isna() | (counts % 1 != 0) | (counts < 0)).to_numpy(dtype=bool)),
+        ("zero_denominator", (counts == 0).to_numpy(dtype=bool))
+    ]
+    if period_columns:
+        years = pd.to_numeric(chunk["year"], errors="coerce")
+        quarters = pd.to_numeric(chunk["quarter"], errors="coerce")
+        checks[1:1] = [
+            ("year_out_of_range", ~years.between(VALID_YEAR_MIN, time.localtime().tm_year).to_numpy(dtype=bool) | (years % 1 != 0).to_numpy(dtype=bool)),
+            ("quarter_out_of_range", ~quarters.isin([1, 2, 3, 4]).to_numpy(dtype=bool))
+        ]
+
+    reasons = np.select([failed for _, failed in checks], [reason for reason, _ in checks], default="").astype(object)
+    candidate = reasons == ""
+    key_parts = [names[candidate].str.lower()]
+    if period_columns:
+        key_parts += [years[candidate].astype(np.int64), quarters[candidate].astype(np.int64)]
+    key_arrays = [part.to_numpy(dtype=object) for part in key_parts]
+    candidate_keys = pd.MultiIndex.from_arrays(key_arrays)
+    spelled_keys = pd.MultiIndex.from_arrays([*key_arrays, raw_names[candidate].to_numpy(dtype=object)])
+    duplicate = spelled_keys.isin(seen_spellings) | spelled_keys.duplicated(keep="first")
+    aliased = ~duplicate & (candidate_keys.isin(seen_keys) | candidate_keys.duplicated(keep="first"))
+    reasons[candidate] = np.select([duplicate, aliased], ["duplicate_key", "alias_collision"], default="")
+
+    accepted = (reasons == "") | (reasons == "alias_collision")
+    valid = pd.DataFrame({"name": names[accepted], "language": names[accepted].str.lower()})
+    if period_columns:
+        valid["year"] = years[accepted].astype(np.int64)
+        valid["quarter"] = quarters[accepted].astype(np.int64)
+    valid[count_column] = counts[accepted].astype(np.int64)
+
+    flagged = reasons != ""
+    quarantine = chunk[flagged].copy()
+    quarantine.insert(0, "action", np.where(reasons[flagged] == "alias_collision", "merged", "dropped"))
+    quarantine.insert(0, "reason", reasons[flagged])
+    return (
+        valid,
+        quarantine,
+        seen_keys.append(candidate_keys[~duplicate & ~aliased]),
+        seen_spellings.append(spelled_keys[~duplicate])
+    )
+
+
+def validate_source(df, source):
+    spec = VALIDATION_SPECS[source]
+    missing_columns = {spec["name_column"], spec["count_column"], *spec["period_columns"]} - set(df.columns)
+    if missing_columns:
+        raise ValueError(f"{source} is missing required columns: {', '.join(sorted(missing_columns))}")
+
+    key_columns = ["language", *spec["period_columns"]]
+    seen_keys = pd.MultiIndex.from_arrays([[] for _ in key_columns])
+    seen_spellings = pd.MultiIndex.from_arrays([[] for _ in range(len(key_columns) + 1)])
+    valid_chunks, quarantine_chunks = [], []
+    for start in range(0, max(len(df), 1), VALIDATION_CHUNK_ROWS):
+        valid, quarantine, seen_keys, seen_spellings = validate_chunk(
+            df.iloc[start:start + VALIDATION_CHUNK_ROWS], spec, seen_keys, seen_spellings
+        )
+        valid_chunks.append(valid)
+        quarantine_chunks.append(quarantine)
+
+    count_column = spec["count_column"]
+    valid = (
+        pd.concat(valid_chunks)
+        .groupby(key_columns, as_index=False, sort=False)
+        .agg(name=("name", "first"), **{count_column: (count_column, "sum")})
+    )
+    valid["name"] = valid.groupby("language", sort=False)["name"].transform("first")
+    quarantine = pd.concat(quarantine_chunks)
+    quarantine.insert(0, "source", source)
+    return valid[["name", *key_columns, count_column]], quarantine
+
+
+def write_quarantine(path, quarantines):
+    quarantine = pd.concat([df.astype(object) for df in quarantines]).rename_axis("row").reset_index()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        quarantine.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return (
+        quarantine.groupby(["source", "reason", "action"]).size()
+        .rename("rows")
+        .reset_index()
+    )
+
+
 text("# GitHub Programming Languages Analytics")
 text("---")
 
+COLUMNAR_STORE_DIR = os.path.join("data", ".columnar")
+COLUMNAR_STORE_FORMAT = 4
+COLUMNAR_SOURCES = ["issues_csv", "prs_csv", "repos_csv"]
+
+
+def normalize_quarterly_counts(df, value_name):
+    return df[["language", "year", "quarter", "count"]].rename(columns={"count": value_name})
+
+
+def build_columnar_store():
+    raw_rows = {}
+    valid_sources, quarantines = [], []
+    for source in COLUMNAR_SOURCES:
+        raw = get_df(source)
+        raw_rows[source] = int(len(raw))
+        valid, quarantine = validate_source(raw, source)
+        valid_sources.append(valid)
+        quarantines.append(quarantine)
+    issues_source, prs_source, repos_source = valid_sources
+    quarantine_summary = write_quarantine(QUARANTINE_PATH, quarantines)
+
+    quarterly = pd.merge(
+        normalize_quarterly_counts(issues_source, "issues"),
+        normalize_quarterly_counts(prs_source, "prs"),
+        on=["language", "year", "quarter"],
+        how="outer"
+    )
+    quarterly["segment"] = np.select(
+        [quarterly["issues"].isna(), quarterly["prs"].notna()],
+        [0, 1],
+        2
+    )
+    quarterly = quarterly.fillna({"issues": 0, "prs": 0}).sort_values(["segment", "language", "year", "quarter"])
+
+    language_names = np.array(sorted(set(quarterly["language"]) | set(repos_source["language"])), dtype=str)
+    language_labels = (
+        pd.concat([repos_source, prs_source, issues_source])
+        .drop_duplicates("language")
+        .set_index("language")["name"]
+        .reindex(language_names)
+    )
+    id_dtype = pd.Categorical.from_codes(np.array([], dtype=int), categories=language_names).codes.dtype
+    segment_sizes = np.bincount(quarterly["segment"], minlength=3)
+    columns = {
+        "language_names": language_names,
+        "language_labels": language_labels.to_numpy(dtype=str),
+        "quarterly_language_id": np.searchsorted(language_names, quarterly["language"].to_numpy(dtype=str)).astype(id_dtype),
+        "quarterly_year": quarterly["year"].to_numpy(dtype=np.int32),
+        "quarterly_quarter": quarterly["quarter"].to_numpy(dtype=np.int32),
+        "quarterly_issues": quarterly["issues"].to_numpy(dtype=np.int64),
+        "quarterly_prs": quarterly["prs"].to_numpy(dtype=np.int64),
+        "repos_language_id": np.searchsorted(language_names, repos_source["language"].to_numpy(dtype=str)).astype(id_dtype),
+        "repos_num_repos": repos_source["num_repos"].to_numpy(dtype=np.int64)
+    }
+    manifest = {
+        "quarterly_rows": int(len(quarterly)),
+        "prs_rows": [0, int(segment_sizes[0] + segment_sizes[1])],
+        "issues_rows": [int(segment_sizes[0]), int(len(quarterly))],
+        "repos_rows": int(len(repos_source)),
+        "source_rows": raw_rows,
+        "valid_rows": int(sum(len(valid) for valid in valid_sources)),
+        "quarantine": quarantine_summary.to_dict("records")
+    }
+    return manifest, columns
+
+
+def write_columnar_store(store_path, manifest, columns):
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    os.makedirs(tmp_path, exist_ok=True)
+    for name, values in columns.items():
+        np.save(os.path.join(tmp_path, f"{name}.npy"), values)
+    with open(os.path.join(tmp_path, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+    try:
+        os.rename(tmp_path, store_path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def open_columnar_store(store_path):
+    with open(os.path.join(store_path, "manifest.json")) as f:
+        manifest = json.load(f)
+    columns = {
+        name[:-len(".npy")]: np.load(os.path.join(store_path, name), mmap_mode="r")
+        for name in os.listdir(store_path)
+        if name.endswith(".npy")
+    }
+    return manifest, columns
+
+
+def load_columnar_store():
+    version = hashlib.sha1(repr((COLUMNAR_STORE_FORMAT, source_version(COLUMNAR_SOURCES))).encode()).hexdigest()[:12]
+    store_path = os.path.join(COLUMNAR_STORE_DIR, version)
+    if not os.path.exists(os.path.join(store_path, "manifest.json")):
+        store = build_columnar_store()
+        try:
+            os.makedirs(COLUMNAR_STORE_DIR, exist_ok=True)
+            write_columnar_store(store_path, *store)
+            store = open_columnar_store(store_path)
+        except OSError:
+            return store
+        for stale in os.listdir(COLUMNAR_STORE_DIR):
+            if stale != version and not stale.endswith(".tmp"):
+                shutil.rmtree(os.path.join(COLUMNAR_STORE_DIR, stale), ignore_errors=True)
+        return store
+    return open_columnar_store(store_path)
+
+
+def columnar_quarterly_view(store, segment, value_name):
+    manifest, columns = store
+    start, stop = manifest[f"{segment}_rows"]
+    return pd.DataFrame({
+        "language": pd.Categorical.from_codes(
+            columns["quarterly_language_id"][start:stop], categories=columns["language_names"]
+        ),
+        "year": columns["quarterly_year"][start:stop],
+        "quarter": columns["quarterly_quarter"][start:stop],
+        value_name: columns[f"quarterly_{segment}"][start:stop]
+    }, copy=False)
+
+
 try:
     connect()
-    issues_df = get_df("issues_csv")
-    prs_df = get_df("prs_csv")
-    repos_df = get_df("repos_csv")
+    columnar_store = load_columnar_store()
+    store_manifest, store_columns = columnar_store
     text("**System Status**: All datasets loaded successfully")
-
-    total_records = sum(len(df) for df in [issues_df, prs_df, repos_df])
-    text(f" **Data Overview**: {total_records:,} total records processed")
+    text(f" **Data Overview**: {sum(store_manifest['source_rows'].values()):,} total records processed")
 
 except Exception as e:
     text(f"❌ **System Error**: {str(e)}")
     text("Please ensure all CSV files are properly uploaded and data source aliases match `preswald.toml`")
-    import sys
     sys.exit(1)
 
-def preprocess_datasets():
-    global issues_df, prs_df, repos_df
-    if issues_df is None or prs_df is None or repos_df is None:
-        raise ValueError("One or more dataframes did not load correctly.")
-    issues_df['count'] = pd.to_numeric(issues_df['count'], errors='coerce').fillna(0)
-    issues_df = issues_df[issues_df['count'] > 0]
-    prs_df['count'] = pd.to_numeric(prs_df['count'], errors='coerce').fillna(0)
-    prs_df = prs_df[prs_df['count'] > 0]
-    repos_df['num_repos'] = pd.to_numeric(repos_df['num_repos'], errors='coerce').fillna(0)
-    repos_df = repos_df[repos_df['num_repos'] > 0]
-    issues_summary = (
-        issues_df.groupby('name')['count']
-        .sum()
-        .reset_index()
-        .rename(columns={'count': 'total_issues'})
-    )
+quarantine_summary = pd.DataFrame(store_manifest["quarantine"], columns=["source", "reason", "action", "rows"])
+quarantined_rows = int(quarantine_summary.loc[quarantine_summary["action"] == "dropped", "rows"].sum())
+merged_rows = int(quarantine_summary.loc[quarantine_summary["action"] == "merged", "rows"].sum())
+text(f"**Data Quality**: {quarantined_rows:,} rows quarantined and {merged_rows:,} alias rows merged, see `{QUARANTINE_PATH}`")
+if len(quarantine_summary) > 0:
+    table(quarantine_summary, title="Quarantined Rows by Check")
 
-    prs_summary = (
-        prs_df.groupby('name')['count']
-        .sum()
-        .reset_index()
-        .rename(columns={'count': 'total_prs'})
+if isinstance(store_columns["quarterly_prs"], np.memmap):
+    text(f"**Columnar Store**: {store_manifest['quarterly_rows']:,} quarterly rows memory-mapped from `{COLUMNAR_STORE_DIR}`")
+else:
+    text(f"**Columnar Store**: `{COLUMNAR_STORE_DIR}` is not writable, {store_manifest['quarterly_rows']:,} quarterly rows held in memory")
+
+def preprocess_datasets(store):
+    manifest, columns = store
+    n_languages = len(columns["language_names"])
+    totals = {}
+    for segment, total_column in [("issues", "total_issues"), ("prs", "total_prs")]:
+        start, stop = manifest[f"{segment}_rows"]
+        totals[total_column] = np.bincount(
+            columns["quarterly_language_id"][start:stop],
+            weights=columns[f"quarterly_{segment}"][start:stop],
+            minlength=n_languages
+        )
+    totals["num_repos"] = np.bincount(
+        columns["repos_language_id"], weights=columns["repos_num_repos"], minlength=n_languages
     )
-
-    activity_summary = pd.merge(
-        issues_summary,
-        prs_summary,
-        on='name',
-        how='outer'
-    ).fillna(0)
-
-    complete_df = pd.merge(
-        activity_summary,
-        repos_df,
-        left_on='name',
-        right_on='language',
-        how='outer'
-    ).fillna(0)
-
-    complete_df['language'] = complete_df['language'].fillna(complete_df['name'])
+    complete_df = pd.DataFrame({"language": columns["language_names"], **totals})
 
     complete_df['development_velocity'] = (
         complete_df['total_prs'] / (complete_df['num_repos'] + 1)
@@ -79,7 +416,7 @@ def preprocess_datasets():
     )
     return complete_df
 
-comprehensive_df = preprocess_datasets()
+comprehensive_df = preprocess_datasets(columnar_store)
 text("## ● Dashboard")
 
 total_languages = len(comprehensive_df)
@@ -99,21 +436,15 @@ kpi_metrics = f"""
 text(kpi_metrics)
 text("##  1. Language Analysis")
 text("### ● Programming Language Market Leaders")
-market_leaders_query = """
-SELECT
-    language,
-    num_repos,
-    ROUND(
-        CAST(num_repos AS FLOAT) /
-        CAST((SELECT SUM(CAST(num_repos AS FLOAT)) FROM repos_csv) AS FLOAT)
-        * 100, 2
-    ) as market_share_pct
-FROM repos_csv
-WHERE CAST(num_repos AS INTEGER) > 0
-ORDER BY market_share_pct DESC
-"""
-
-market_leaders = query(market_leaders_query, "repos_csv")
+market_leaders = (
+    pd.DataFrame({
+        'language': store_columns['language_labels'][store_columns['repos_language_id']],
+        'num_repos': store_columns['repos_num_repos']
+    })
+    .assign(market_share_pct=lambda df: (df['num_repos'] / df['num_repos'].sum() * 100).round(2))
+    .sort_values('market_share_pct', ascending=False)
+    .reset_index(drop=True)
+)
 
 if market_leaders is not None and not market_leaders.empty:
 
@@ -179,33 +510,24 @@ else:
     text("No data available for market leaders.")
 
 text("## 2. Language Evolution & Growth Patterns")
-issues_data = """
-SELECT * FROM issues_csv
-"""
-all_data = query(issues_data, "issues_csv")
+issues_quarterly = columnar_quarterly_view(columnar_store, "issues", "issues_count")
+all_data = (
+    issues_quarterly
+    .assign(language=issues_quarterly["language"].cat.rename_categories(store_columns["language_labels"]))
+    .rename(columns={"language": "name", "issues_count": "count"})
+    .sort_values(["name", "year", "quarter"])
+    .reset_index(drop=True)
+)
 table(all_data, title="Data in issues_csv")
-yearly_issues = query(
-    """
-    SELECT
-      TRIM(LOWER(name)) AS language_normalized,
-      year,
-      SUM(CAST(count AS INTEGER)) AS issues_count
-    FROM (
-      SELECT DISTINCT
-        TRIM(LOWER(name)) AS name,
-        year,
-        count
-      FROM issues_csv
-      WHERE name IS NOT NULL AND year IS NOT NULL AND count IS NOT NULL
-    )
-    GROUP BY language_normalized, year
-    ORDER BY language_normalized, year
-    """,
-    "issues_csv"
+last_complete_issue_year = (last_complete_period(issues_quarterly, "issues_count") + 1) // 4 - 1
+yearly_issues = (
+    issues_quarterly.groupby(["language", "year"], as_index=False, observed=True)["issues_count"]
+    .sum()
+    .astype({"language": str})
+    .rename(columns={"language": "language_normalized"})
+    .sort_values(["language_normalized", "year"])
 )
-
-yearly_issues["year"] = yearly_issues["year"].astype(int)
-yearly_issues = yearly_issues.sort_values(["language_normalized", "year"])
+yearly_issues = yearly_issues[yearly_issues["year"] <= last_complete_issue_year]
 yearly_issues["prev_year_issues"] = yearly_issues.groupby("language_normalized")["issues_count"].shift(1)
 yearly_issues["growth_rate_pct"] = (
     (yearly_issues["issues_count"] - yearly_issues["prev_year_issues"])
@@ -254,6 +576,60 @@ table(
 )
 
 
+FORECAST_HORIZONS = (4, 8, 12)
+
+
+forecast_window = selectbox(
+    "Forecast horizon",
+    options=[f"{horizon} quarters" for horizon in FORECAST_HORIZONS],
+    default=f"{FORECAST_HORIZONS[0]} quarters"
+)
+forecast_horizon = int(forecast_window.split()[0])
+
+
+
+def forecast_issues(horizon):
+    languages, first_period, matrix = build_quarterly_matrix(issues_quarterly, "issues_count")
+    matrix = trim_incomplete_periods(matrix)
+    return (languages, first_period, matrix, *forecast_counts(matrix, horizon))
+
+
+issue_languages, issue_first_period, issue_matrix, issue_point, issue_lower, issue_upper = cached_stage(
+    "forecast_issues", ["issues_csv"], lambda: forecast_issues(forecast_horizon), params=(forecast_horizon, FORECAST_PARAMETERS)
+)
+issue_active = active_series(issue_matrix)
+
+issue_periods = issue_first_period + np.arange(issue_matrix.shape[1] + forecast_horizon)
+issue_years = issue_periods // 4
+issue_observed = np.nan_to_num(issue_matrix)
+issue_projection_years = [
+    year for year in np.unique(issue_years[issue_matrix.shape[1]:])
+    if (issue_years == year).sum() == 4
+]
+issue_projection_blocks = {
+    "projected_issues": np.hstack([issue_observed, issue_point]),
+    "projected_issues_lower": np.hstack([issue_observed, issue_lower]),
+    "projected_issues_upper": np.hstack([issue_observed, issue_upper])
+}
+issue_yearly_projection = pd.DataFrame({
+    "language_normalized": np.repeat(issue_languages, len(issue_projection_years)),
+    "year": np.tile(np.array(issue_projection_years, dtype=int), len(issue_languages)),
+    **{
+        column: np.stack([block[:, issue_years == year].sum(axis=1) for year in issue_projection_years], axis=1).ravel()
+        for column, block in issue_projection_blocks.items()
+    }
+})
+issue_yearly_projection = issue_yearly_projection[
+    issue_yearly_projection["language_normalized"].isin(issue_languages[issue_active])
+    & issue_yearly_projection["language_normalized"].isin(yearly_issues["language_normalized"])
+]
+text(
+    f"- Forecast: damped Holt trend fitted jointly for {len(issue_languages):,} languages, "
+    f"projected for the {int(issue_active.sum()):,} with data in the last observed quarter, "
+    f"{forecast_horizon} quarters ahead from {period_label(issue_first_period + issue_matrix.shape[1] - 1)} "
+    f"with {FORECAST_INTERVAL_Z:.2f}σ prediction intervals"
+)
+
 fig = px.line(
     yearly_issues,
     x="year",
@@ -283,6 +659,26 @@ fig.update_layout(
 fig.update_xaxes(showgrid=True, gridcolor='lightgrey')
 fig.update_yaxes(showgrid=True, gridcolor='lightgrey', title_text="Total Issues")
 
+trace_colors = {trace.name: trace.line.color for trace in fig.data}
+for lang, lang_projection in issue_yearly_projection.groupby("language_normalized", sort=False):
+    fig.add_trace(go.Scatter(
+        x=lang_projection["year"],
+        y=lang_projection["projected_issues"],
+        mode="lines+markers",
+        name=f"{lang} (projected)",
+        legendgroup=lang,
+        showlegend=False,
+        line=dict(color=trace_colors.get(lang), dash="dash"),
+        error_y=dict(
+            type="data",
+            symmetric=False,
+            array=lang_projection["projected_issues_upper"] - lang_projection["projected_issues"],
+            arrayminus=lang_projection["projected_issues"] - lang_projection["projected_issues_lower"],
+            thickness=1
+        ),
+        hovertemplate=f"<b>{lang}</b><br>%{{x}}: %{{y:,.0f}} projected issues<extra></extra>"
+    ))
+
 plotly(fig)
 
 
@@ -341,61 +737,113 @@ fig.update_layout(
 
 plotly(fig)
 
-prs_clean = query("""
-    SELECT 
-        TRIM(LOWER(name)) AS language,
-        year,
-        quarter,
-        CAST(count AS INTEGER) AS pr_count
-    FROM prs_csv
-    WHERE name IS NOT NULL 
-    AND year IS NOT NULL 
-    AND quarter IS NOT NULL 
-    AND count IS NOT NULL
-    ORDER BY language, year, quarter
-""", "prs_csv")
+prs_clean = columnar_quarterly_view(columnar_store, "prs", "pr_count")
 
 text("## 3. Momentum Analysis of Languages")
 text("### **Question**: Which languages show accelerating vs decelerating development momentum?")
 
-momentum_data = []
-languages = prs_clean['language'].unique()
+MOMENTUM_WINDOWS = (3, 4, 8, 12)
+MOMENTUM_EWMA_SPAN = 4
+
+
+def rolling_momentum_engine(series_df, windows=MOMENTUM_WINDOWS, ewma_span=MOMENTUM_EWMA_SPAN, min_quarters=4):
+    ordered = series_df.sort_values(['language', 'year', 'quarter'], kind='stable')
+    codes, lang_names = pd.factorize(ordered['language'], sort=True)
+    counts = ordered['pr_count'].to_numpy(dtype=float)
+    n_rows = len(counts)
+    n_langs = len(lang_names)
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if n_rows else np.array([], dtype=int)
+    ends = np.r_[starts[1:], n_rows]
+    lengths = ends - starts
+    position = np.arange(n_rows) - np.repeat(starts, lengths)
+
+    prev = np.r_[counts[:1], counts[:-1]]
+    prev[starts] = counts[starts]
+    qoq_pct = (counts - prev) / prev * 100
+
+    cs = np.r_[0.0, np.cumsum(qoq_pct)]
+    cs2 = np.r_[0.0, np.cumsum(qoq_pct * qoq_pct)]
+
+    def window_stats(lo, hi, size):
+        total = cs[hi] - cs[lo]
+        mean = total / size
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var = (cs2[hi] - cs2[lo] - total * mean) / (size - 1)
+        return mean, np.sqrt(np.clip(var, 0, None))
+
+    _, full_std = window_stats(starts, ends, lengths)
+
+    w = np.asarray(windows)[:, None]
+    valid = lengths >= np.maximum(w, min_quarters)
+    size = np.minimum(w, lengths)
+    early_avg, _ = window_stats(starts, starts + size, size)
+    recent_avg, recent_std = window_stats(ends - size, ends, size)
+    acceleration = np.where(valid, recent_avg - early_avg, np.nan)
+
+    alpha = 2 / (ewma_span + 1)
+    weights = (1 - alpha) ** (np.repeat(lengths, lengths) - 1 - position)
+    ewma = (
+        np.bincount(codes, weights=weights * qoq_pct, minlength=n_langs)
+        / np.bincount(codes, weights=weights, minlength=n_langs)
+    )
 
-for lang in languages:
-    lang_data = prs_clean[prs_clean['language'] == lang].sort_values(['year', 'quarter'])
-    
-    if len(lang_data) >= 4:
-        lang_data['prev_count'] = lang_data['pr_count'].shift(1)
-        lang_data['qoq_change'] = lang_data['pr_count'] - lang_data['prev_count']
-        lang_data['qoq_pct'] = (lang_data['qoq_change'] / lang_data['prev_count'] * 100).fillna(0)
-        
-        recent_quarters = lang_data.tail(3)
-        early_quarters = lang_data.head(3)
-        
-        recent_avg_growth = recent_quarters['qoq_pct'].mean()
-        early_avg_growth = early_quarters['qoq_pct'].mean()
-        
-        momentum_acceleration = recent_avg_growth - early_avg_growth
-        
-        growth_consistency = 100 - min(100, lang_data['qoq_pct'].std())
-        
-        total_prs = lang_data['pr_count'].sum()
-        peak_quarter = lang_data['pr_count'].max()
-        latest_quarter = lang_data['pr_count'].iloc[-1]
-        
-        momentum_data.append({
-            'language': lang.title(),
-            'momentum_acceleration': round(momentum_acceleration, 2),
-            'growth_consistency_score': round(growth_consistency, 2),
-            'recent_avg_growth_pct': round(recent_avg_growth, 2),
-            'total_prs': total_prs,
-            'peak_to_current_ratio': round(peak_quarter / latest_quarter, 2) if latest_quarter > 0 else 0,
-            'momentum_category': 'Accelerating' if momentum_acceleration > 5 else 'Stable' if momentum_acceleration > -5 else 'Decelerating'
-        })
-
-momentum_df = pd.DataFrame(momentum_data).sort_values('momentum_acceleration', ascending=False)
+    latest = counts[ends - 1] if n_rows else np.array([])
+    peak = np.maximum.reduceat(counts, starts) if n_rows else np.array([])
+
+    engine_df = pd.DataFrame({
+        'language': lang_names,
+        'quarters_active': lengths,
+        'total_prs': np.bincount(codes, weights=counts, minlength=n_langs).astype(int),
+        'growth_consistency_score': 100 - np.minimum(100, full_std),
+        'ewma_momentum_pct': ewma,
+        'peak_to_current_ratio': peak / latest,
+    })
+    for i, window in enumerate(windows):
+        engine_df[f'momentum_acceleration_{window}q'] = np.where(valid[i], acceleration[i], np.nan)
+        engine_df[f'recent_avg_growth_pct_{window}q'] = np.where(valid[i], recent_avg[i], np.nan)
+        engine_df[f'rolling_volatility_{window}q'] = np.where(valid[i], recent_std[i], np.nan)
+    return engine_df[engine_df['quarters_active'] >= min_quarters].reset_index(drop=True)
+
+
+momentum_engine_df = cached_stage(
+    "rolling_momentum_engine",
+    ["prs_csv"],
+    lambda: rolling_momentum_engine(prs_clean),
+    params=(MOMENTUM_WINDOWS, MOMENTUM_EWMA_SPAN)
+)
+
+momentum_window = selectbox(
+    "Momentum window",
+    options=[f"{window} quarters" for window in MOMENTUM_WINDOWS],
+    default=f"{MOMENTUM_WINDOWS[0]} quarters"
+)
+selected_window = int(momentum_window.split()[0])
+
+momentum_acceleration = momentum_engine_df[f'momentum_acceleration_{selected_window}q']
+momentum_df = pd.DataFrame({
+    'language': momentum_engine_df['language'].str.title(),
+    'momentum_acceleration': momentum_acceleration.round(2),
+    'growth_consistency_score': momentum_engine_df['growth_consistency_score'].round(2),
+    'recent_avg_growth_pct': momentum_engine_df[f'recent_avg_growth_pct_{selected_window}q'].round(2),
+    'ewma_momentum_pct': momentum_engine_df['ewma_momentum_pct'].round(2),
+    'rolling_volatility_pct': momentum_engine_df[f'rolling_volatility_{selected_window}q'].round(2),
+    'total_prs': momentum_engine_df['total_prs'],
+    'peak_to_current_ratio': momentum_engine_df['peak_to_current_ratio'].round(2),
+    'momentum_category': np.select(
+        [momentum_acceleration > 5, momentum_acceleration > -5],
+        ['Accelerating', 'Stable'],
+        'Decelerating'
+    )
+})
+momentum_df = momentum_df.dropna(subset=['momentum_acceleration']).sort_values('momentum_acceleration', ascending=False)
+text(f"- Momentum window: **{selected_window} quarters** (EWMA span: {MOMENTUM_EWMA_SPAN} quarters)")
 table(momentum_df, title=" Language Momentum Report")
 
+multi_window_momentum = momentum_engine_df[['language'] + [f'momentum_acceleration_{window}q' for window in MOMENTUM_WINDOWS]].copy()
+multi_window_momentum['language'] = multi_window_momentum['language'].str.title()
+table(multi_window_momentum.round(2), title=" Momentum Acceleration by Window")
+
 text(f"**Debug Info**: Found {len(momentum_df)} languages for momentum analysis")
 table(momentum_df, title="Momentum Data for Debugging")
 
@@ -466,12 +914,17 @@ else:
 text("### ● Competitive Market Share ")
 text("### **Question**: How is market share shifting between competing languages in the same domain?")
 
-quarterly_totals = prs_clean.groupby(['year', 'quarter'])['pr_count'].sum().reset_index()
-quarterly_totals['period'] = quarterly_totals['year'].astype(str) + '-Q' + quarterly_totals['quarter'].astype(str)
 
-prs_with_share = prs_clean.merge(quarterly_totals[['year', 'quarter', 'pr_count']], 
-                                on=['year', 'quarter'], suffixes=('', '_total'))
-prs_with_share['market_share_pct'] = (prs_with_share['pr_count'] / prs_with_share['pr_count_total'] * 100)
+
+def market_share_frame(series_df):
+    quarterly_totals = series_df.groupby(['year', 'quarter'])['pr_count'].sum().reset_index()
+    share_df = series_df.merge(quarterly_totals[['year', 'quarter', 'pr_count']],
+                               on=['year', 'quarter'], suffixes=('', '_total'))
+    share_df['market_share_pct'] = (share_df['pr_count'] / share_df['pr_count_total'] * 100)
+    return share_df
+
+
+prs_with_share = cached_stage("market_share", ["prs_csv"], lambda: market_share_frame(prs_clean))
 
 web_languages = ['javascript', 'php', 'ruby', 'html', 'css', 'typescript', 'nodejs', 'angular', 'react', 'vue', 'asp.net', 'go', 'dart', 'elixir', 'svelte', 'jquery', 'graphql']
 systems_languages = ['c', 'c++', 'java', 'c#', 'rust', 'assembly', 'fortran', 'pascal', 'ada', 'delphi', 'objective-c', 'scala', 'lua']
@@ -518,22 +971,29 @@ def analyze_competitive_cluster(languages, cluster_name):
     
     return competition_analysis
 
-web_competition = analyze_competitive_cluster(web_languages, 'Web Technologies')
-systems_competition = analyze_competitive_cluster(systems_languages, 'Systems Programming')
-data_science_competition = analyze_competitive_cluster(data_science_languages, 'Data Science & Machine Learning')
-mobile_competition = analyze_competitive_cluster(mobile_languages, 'Mobile Development')
-game_dev_competition = analyze_competitive_cluster(game_dev_languages, 'Game Development')
-embedded_competition = analyze_competitive_cluster(embedded_languages, 'Embedded Systems')
-functional_competition = analyze_competitive_cluster(functional_languages, 'Functional Programming')
-scripting_competition = analyze_competitive_cluster(scripting_languages, 'Scripting Languages')
-enterprise_competition = analyze_competitive_cluster(enterprise_languages, 'Enterprise Software')
-markup_query_competition = analyze_competitive_cluster(markup_query_languages, 'Markup and Query Languages')
-cloud_devops_competition = analyze_competitive_cluster(cloud_devops_languages, 'Cloud and DevOps')
-oop_competition = analyze_competitive_cluster(oop_languages, 'Object-Oriented Programming')
-
-all_competition = pd.DataFrame(web_competition + systems_competition + data_science_competition + mobile_competition +
-                               game_dev_competition + embedded_competition + functional_competition + scripting_competition +
-                               enterprise_competition + markup_query_competition + cloud_devops_competition + oop_competition)
+competitive_clusters = (
+    (web_languages, 'Web Technologies'),
+    (systems_languages, 'Systems Programming'),
+    (data_science_languages, 'Data Science & Machine Learning'),
+    (mobile_languages, 'Mobile Development'),
+    (game_dev_languages, 'Game Development'),
+    (embedded_languages, 'Embedded Systems'),
+    (functional_languages, 'Functional Programming'),
+    (scripting_languages, 'Scripting Languages'),
+    (enterprise_languages, 'Enterprise Software'),
+    (markup_query_languages, 'Markup and Query Languages'),
+    (cloud_devops_languages, 'Cloud and DevOps'),
+    (oop_languages, 'Object-Oriented Programming')
+)
+all_competition = cached_stage(
+    "competitive_clusters",
+    ["prs_csv"],
+    lambda: pd.DataFrame([
+        row for languages, cluster_name in competitive_clusters
+        for row in analyze_competitive_cluster(languages, cluster_name)
+    ]),
+    params=tuple((tuple(languages), cluster_name) for languages, cluster_name in competitive_clusters)
+)
 
 table(all_competition, title=" Competitive Market Share Analysis")
 
@@ -545,6 +1005,28 @@ all_languages = web_languages + systems_languages + data_science_languages + mob
                 embedded_languages + functional_languages + scripting_languages + enterprise_languages + \
                 markup_query_languages + cloud_devops_languages + oop_languages
 
+
+
+def forecast_prs(horizon):
+    languages, first_period, matrix = build_quarterly_matrix(prs_clean, 'pr_count')
+    matrix = trim_incomplete_periods(matrix)
+    shares = matrix / np.nansum(matrix, axis=0) * 100
+    share_forecast = [np.clip(values, 0, 100) for values in fit_holt_batch(shares, horizon)]
+    return (languages, first_period, matrix, shares, *forecast_counts(matrix, horizon), *share_forecast)
+
+
+(
+    pr_languages, pr_first_period, pr_matrix, share_matrix,
+    pr_point, pr_lower, pr_upper, share_point, share_lower, share_upper
+) = cached_stage(
+    "forecast_prs", ["prs_csv"], lambda: forecast_prs(forecast_horizon), params=(forecast_horizon, FORECAST_PARAMETERS)
+)
+pr_active = active_series(pr_matrix)
+pr_last_period = pr_first_period + pr_matrix.shape[1] - 1
+forecast_periods = [period_label(pr_last_period + step) for step in range(1, forecast_horizon + 1)]
+forecast_rows = {lang: row for row, lang in enumerate(pr_languages) if pr_active[row]}
+
+trace_languages = []
 for i, lang in enumerate(all_languages):
     lang_data = prs_with_share[prs_with_share['language'] == lang].sort_values(['year', 'quarter'])
     if not lang_data.empty:
@@ -558,11 +1040,35 @@ for i, lang in enumerate(all_languages):
             marker=dict(size=6),
             visible=True
         ))
+        trace_languages.append(lang)
+
+        row = forecast_rows.get(lang)
+        if row is not None:
+            fig.add_trace(go.Scatter(
+                x=forecast_periods,
+                y=share_point[row],
+                mode='lines+markers',
+                name=f'{lang.title()} (projected)',
+                legendgroup=lang,
+                showlegend=False,
+                line=dict(color=colors[i % len(colors)], width=2, dash='dash'),
+                marker=dict(size=6),
+                error_y=dict(
+                    type='data',
+                    symmetric=False,
+                    array=share_upper[row] - share_point[row],
+                    arrayminus=share_point[row] - share_lower[row],
+                    thickness=1
+                ),
+                visible=True
+            ))
+            trace_languages.append(lang)
 
 fig.update_layout(
     title='Programming Languages Market Share Evolution',
     xaxis_title='Time Period',
     yaxis_title='Market Share (%)',
+    xaxis=dict(categoryorder='category ascending'),
     height=500,
     plot_bgcolor='white',
     paper_bgcolor='white',
@@ -572,67 +1078,67 @@ fig.update_layout(
                 {
                     'label': 'All',
                     'method': 'update',
-                    'args': [{'visible': [True] * len(all_languages)}, {'title': 'All Languages Market Share Evolution'}]
+                    'args': [{'visible': [True] * len(trace_languages)}, {'title': 'All Languages Market Share Evolution'}]
                 },
                 {
                     'label': 'Web',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in web_languages else False for lang in all_languages]}, {'title': 'Web Technologies Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in web_languages else False for lang in trace_languages]}, {'title': 'Web Technologies Market Share Evolution'}]
                 },
                 {
                     'label': 'Systems',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in systems_languages else False for lang in all_languages]}, {'title': 'Systems Programming Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in systems_languages else False for lang in trace_languages]}, {'title': 'Systems Programming Market Share Evolution'}]
                 },
                 {
                     'label': 'Data Science',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in data_science_languages else False for lang in all_languages]}, {'title': 'Data Science Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in data_science_languages else False for lang in trace_languages]}, {'title': 'Data Science Market Share Evolution'}]
                 },
                 {
                     'label': 'Mobile',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in mobile_languages else False for lang in all_languages]}, {'title': 'Mobile Development Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in mobile_languages else False for lang in trace_languages]}, {'title': 'Mobile Development Market Share Evolution'}]
                 },
                 {
                     'label': 'Game Dev',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in game_dev_languages else False for lang in all_languages]}, {'title': 'Game Development Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in game_dev_languages else False for lang in trace_languages]}, {'title': 'Game Development Market Share Evolution'}]
                 },
                 {
                     'label': 'Embedded',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in embedded_languages else False for lang in all_languages]}, {'title': 'Embedded Systems Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in embedded_languages else False for lang in trace_languages]}, {'title': 'Embedded Systems Market Share Evolution'}]
                 },
                 {
                     'label': 'Functional',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in functional_languages else False for lang in all_languages]}, {'title': 'Functional Programming Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in functional_languages else False for lang in trace_languages]}, {'title': 'Functional Programming Market Share Evolution'}]
                 },
                 {
                     'label': 'Scripting',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in scripting_languages else False for lang in all_languages]}, {'title': 'Scripting Languages Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in scripting_languages else False for lang in trace_languages]}, {'title': 'Scripting Languages Market Share Evolution'}]
                 },
                 {
                     'label': 'Enterprise',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in enterprise_languages else False for lang in all_languages]}, {'title': 'Enterprise Software Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in enterprise_languages else False for lang in trace_languages]}, {'title': 'Enterprise Software Market Share Evolution'}]
                 },
                 {
                     'label': 'Markup/Query',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in markup_query_languages else False for lang in all_languages]}, {'title': 'Markup and Query Languages Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in markup_query_languages else False for lang in trace_languages]}, {'title': 'Markup and Query Languages Market Share Evolution'}]
                 },
                 {
                     'label': 'Cloud/DevOps',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in cloud_devops_languages else False for lang in all_languages]}, {'title': 'Cloud and DevOps Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in cloud_devops_languages else False for lang in trace_languages]}, {'title': 'Cloud and DevOps Market Share Evolution'}]
                 },
                 {
                     'label': 'OOP',
                     'method': 'update',
-                    'args': [{'visible': [True if lang in oop_languages else False for lang in all_languages]}, {'title': 'Object-Oriented Programming Market Share Evolution'}]
+                    'args': [{'visible': [True if lang in oop_languages else False for lang in trace_languages]}, {'title': 'Object-Oriented Programming Market Share Evolution'}]
                 }
             ],
             'direction': 'down',
@@ -648,74 +1154,237 @@ fig.update_layout(
 
 plotly(fig)
 
+latest_prs = pr_matrix[:, -1]
+latest_share = share_matrix[:, -1]
+forecast_df = pd.DataFrame({
+    'language': pd.Series(pr_languages).str.title(),
+    'latest_quarter_prs': np.nan_to_num(latest_prs).astype(int),
+    'projected_prs': pr_point[:, -1].round(0),
+    'projected_prs_lower': pr_lower[:, -1].round(0),
+    'projected_prs_upper': pr_upper[:, -1].round(0),
+    'latest_share_pct': np.nan_to_num(latest_share).round(2),
+    'projected_share_pct': share_point[:, -1].round(2),
+    'projected_share_lower': share_lower[:, -1].round(2),
+    'projected_share_upper': share_upper[:, -1].round(2)
+})
+forecast_df = forecast_df[pr_active].sort_values('projected_prs', ascending=False)
+table(forecast_df, title=f" Projected Activity at {forecast_periods[-1]} ({forecast_horizon} quarters ahead)")
+
+
+PERFORMANCE_CLUSTERS = 4
+PERFORMANCE_FEATURES = [
+    'avg_quarterly_prs',
+    'coefficient_of_variation',
+    'overall_growth_pct',
+    'momentum_acceleration',
+    'avg_market_share_pct'
+]
+PERFORMANCE_MOMENTUM_WINDOW = MOMENTUM_WINDOWS[0]
+CLUSTER_STATE_PATH = os.path.join('data', '.performance_clusters.npz')
+CLUSTER_STATE_TOLERANCE = 1e-2
+
+
+def load_cluster_state(path, n_clusters, feature_names):
+    try:
+        with np.load(path) as state:
+            centroids = state['centroids']
+            if list(state['features']) == list(feature_names) and centroids.shape == (n_clusters, len(feature_names)):
+                return centroids
+    except (OSError, KeyError, ValueError):
+        pass
+    return None
+
+
+def save_cluster_state(path, centroids, feature_names):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, centroids=centroids, features=np.array(feature_names))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def assign_clusters(features, centroids):
+    distances = (
+        (features ** 2).sum(axis=1)[:, None]
+        - 2 * features @ centroids.T
+        + (centroids ** 2).sum(axis=1)[None, :]
+    )
+    return distances.argmin(axis=1)
+
+
+def minibatch_kmeans(features, n_clusters, init_centroids=None, batch_size=2048, max_iter=100, tol=1e-2, seed=42):
+    rng = np.random.default_rng(seed)
+    n_samples = len(features)
+
+    if init_centroids is not None:
+        centroids = init_centroids.astype(float)
+        seen = np.full(n_clusters, float(min(batch_size, n_samples)))
+    else:
+        sample = features[rng.choice(n_samples, min(n_samples, 10 * batch_size), replace=False)]
+        centroids = sample[[rng.integers(len(sample))]]
+        for _ in range(1, n_clusters):
+            sq_dist = ((sample[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+            total = sq_dist.sum()
+            probs = sq_dist / total if total > 0 else None
+            centroids = np.vstack([centroids, sample[rng.choice(len(sample), p=probs)]])
+        seen = np.zeros(n_clusters)
+
+    for iteration in range(max_iter):
+        batch = features if n_samples <= batch_size else features[rng.integers(0, n_samples, batch_size)]
+        labels = assign_clusters(batch, centroids)
+        batch_counts = np.bincount(labels, minlength=n_clusters)
+        batch_sums = np.zeros_like(centroids)
+        np.add.at(batch_sums, labels, batch)
+
+        seen = batch_counts.astype(float) if n_samples <= batch_size else seen + batch_counts
+        updated = batch_counts > 0
+        shift = np.zeros(n_clusters)
+        step = (batch_sums[updated] - batch_counts[updated, None] * centroids[updated]) / seen[updated, None]
+        centroids[updated] += step
+        shift[updated] = np.sqrt((step ** 2).sum(axis=1))
+        if shift.max() < tol:
+            break
+
+    return assign_clusters(features, centroids), centroids, iteration + 1
+
 
 text("## ● Language Performance ")
 text("### **Question**: Can we identify performance patterns and cluster similar languages?")
 
-performance_data = []
+def performance_features():
+    ordered_prs = prs_clean.sort_values(['language', 'year', 'quarter'])
+    performance_df = (
+        ordered_prs.groupby('language', sort=True, observed=True)['pr_count']
+        .agg(
+            total_prs='sum',
+            avg_quarterly_prs='mean',
+            peak_quarter_prs='max',
+            pr_std='std',
+            first_quarter='first',
+            last_quarter='last',
+            quarters_active='size'
+        )
+        .reset_index()
+    )
+    performance_df = performance_df[performance_df['quarters_active'] >= 2].copy()
 
-for lang in languages:
-    lang_data = prs_clean[prs_clean['language'] == lang].sort_values(['year', 'quarter'])
-    
-    if len(lang_data) >= 2:
-        total_prs = lang_data['pr_count'].sum()
-        avg_prs = lang_data['pr_count'].mean()
-        max_prs = lang_data['pr_count'].max()
-        min_prs = lang_data['pr_count'].min()
-        
-        pr_std = lang_data['pr_count'].std()
-        coefficient_variation = (pr_std / avg_prs * 100) if avg_prs > 0 else 0
-        
-        first_quarter = lang_data['pr_count'].iloc[0]
-        last_quarter = lang_data['pr_count'].iloc[-1]
-        overall_growth = ((last_quarter - first_quarter) / first_quarter * 100) if first_quarter > 0 else 0
-        
-        if total_prs > 50000:
-            size_category = 'High Volume'
-        elif total_prs > 10000:
-            size_category = 'Medium Volume'
-        else:
-            size_category = 'Low Volume'
-            
-        stability_category = 'Stable' if coefficient_variation < 50 else 'Variable' if coefficient_variation < 100 else 'Highly Variable'
-        
-        performance_data.append({
-            'language': lang.title(),
-            'total_prs': total_prs,
-            'avg_quarterly_prs': round(avg_prs, 1),
-            'peak_quarter_prs': max_prs,
-            'coefficient_of_variation': round(coefficient_variation, 1),
-            'overall_growth_pct': round(overall_growth, 1),
-            'size_category': size_category,
-            'stability_category': stability_category,
-            'quarters_active': len(lang_data)
-        })
-
-performance_df = pd.DataFrame(performance_data).sort_values('total_prs', ascending=False)
+    performance_df['coefficient_of_variation'] = performance_df['pr_std'] / performance_df['avg_quarterly_prs'] * 100
+    performance_df['overall_growth_pct'] = (
+        (performance_df['last_quarter'] - performance_df['first_quarter']) / performance_df['first_quarter'] * 100
+    )
+    performance_df['momentum_acceleration'] = (
+        performance_df['language']
+        .map(momentum_engine_df.set_index('language')[f'momentum_acceleration_{PERFORMANCE_MOMENTUM_WINDOW}q'].round(2))
+    )
+    performance_df['avg_market_share_pct'] = (
+        performance_df['language']
+        .map(prs_with_share.groupby('language', observed=True)['market_share_pct'].mean())
+        .fillna(0)
+    )
+    performance_df['size_category'] = np.select(
+        [performance_df['total_prs'] > 50000, performance_df['total_prs'] > 10000],
+        ['High Volume', 'Medium Volume'],
+        'Low Volume'
+    )
+    performance_df['stability_category'] = np.select(
+        [performance_df['coefficient_of_variation'] < 50, performance_df['coefficient_of_variation'] < 100],
+        ['Stable', 'Variable'],
+        'Highly Variable'
+    )
+    return performance_df
+
+
+performance_df = cached_stage(
+    "performance_features",
+    ["prs_csv"],
+    performance_features,
+    params=(PERFORMANCE_MOMENTUM_WINDOW, MOMENTUM_WINDOWS, MOMENTUM_EWMA_SPAN)
+)
+
+raw_features = performance_df[PERFORMANCE_FEATURES].to_numpy(dtype=float)
+raw_features = np.sign(raw_features) * np.log1p(np.abs(raw_features))
+feature_std = np.nanstd(raw_features, axis=0)
+cluster_features = (raw_features - np.nanmean(raw_features, axis=0)) / np.where(feature_std > 0, feature_std, 1)
+cluster_features = np.where(np.isnan(cluster_features), 0.0, cluster_features)
+n_performance_clusters = min(PERFORMANCE_CLUSTERS, len(performance_df))
+
+if n_performance_clusters > 0:
+    previous_centroids = load_cluster_state(CLUSTER_STATE_PATH, n_performance_clusters, PERFORMANCE_FEATURES)
+    cluster_labels, cluster_centroids, cluster_iterations = minibatch_kmeans(
+        cluster_features,
+        n_performance_clusters,
+        init_centroids=previous_centroids
+    )
+
+    centroid_order = np.argsort(-cluster_centroids[:, 0], kind='stable')
+    cluster_centroids = cluster_centroids[centroid_order]
+    cluster_labels = np.argsort(centroid_order)[cluster_labels]
+    if previous_centroids is None or not np.allclose(
+        previous_centroids, cluster_centroids, rtol=0, atol=CLUSTER_STATE_TOLERANCE
+    ):
+        save_cluster_state(CLUSTER_STATE_PATH, cluster_centroids, PERFORMANCE_FEATURES)
+
+    performance_df['performance_cluster'] = [f"Cluster {label + 1}" for label in cluster_labels]
+    text(
+        f"- Mini-batch k-means: **{n_performance_clusters} clusters** on {PERFORMANCE_MOMENTUM_WINDOW}-quarter momentum, "
+        f"converged in {cluster_iterations} iterations "
+        f"({'warm start from previous run' if previous_centroids is not None else 'k-means++ initialisation'})"
+    )
+else:
+    performance_df['performance_cluster'] = []
+
+performance_df['language'] = performance_df['language'].str.title()
+performance_df['avg_quarterly_prs'] = performance_df['avg_quarterly_prs'].round(1)
+performance_df['coefficient_of_variation'] = performance_df['coefficient_of_variation'].round(1)
+performance_df['overall_growth_pct'] = performance_df['overall_growth_pct'].round(1)
+performance_df['avg_market_share_pct'] = performance_df['avg_market_share_pct'].round(2)
+performance_df = performance_df[[
+    'language',
+    'total_prs',
+    'avg_quarterly_prs',
+    'peak_quarter_prs',
+    'coefficient_of_variation',
+    'overall_growth_pct',
+    'momentum_acceleration',
+    'avg_market_share_pct',
+    'size_category',
+    'stability_category',
+    'performance_cluster',
+    'quarters_active'
+]].sort_values('total_prs', ascending=False)
 table(performance_df, title=" Language Performance  Analysis")
 
-performance_df_filtered = performance_df
+cluster_profile = (
+    performance_df.groupby('performance_cluster')[PERFORMANCE_FEATURES]
+    .mean()
+    .round(2)
+    .assign(languages=performance_df.groupby('performance_cluster').size())
+    .reset_index()
+)
+table(cluster_profile, title=" Performance Cluster Profiles")
 
 fig4 = px.scatter(
     performance_df, 
     x='avg_quarterly_prs',
     y='overall_growth_pct',
-    color='stability_category',
+    color='performance_cluster',
     size='total_prs',
     hover_name='language',
+    hover_data=['stability_category', 'momentum_acceleration', 'avg_market_share_pct'],
     title="Language Performance Clustering Analysis",
     labels={
         'avg_quarterly_prs': 'Average Quarterly PRs',
         'overall_growth_pct': 'Overall Growth (%)',
+        'performance_cluster': 'Performance Cluster',
         'stability_category': 'Stability Category',
+        'momentum_acceleration': 'Momentum Acceleration (%)',
+        'avg_market_share_pct': 'Average Market Share (%)',
         'total_prs': 'Total PRs',
         'language': 'Language'
     },
-    color_discrete_map={
-        'Stable': 'green',
-        'Variable': 'yellow',
-        'Highly Variable': 'red'
-    },
+    category_orders={'performance_cluster': sorted(performance_df['performance_cluster'].unique())},
     opacity=0.7,
 )
 
@@ -775,6 +1444,11 @@ if len(momentum_df) > 0:
 perf_stats = performance_df['coefficient_of_variation']
 text(f"**Performance Variability**: Mean = {perf_stats.mean():.1f}%, Languages with high stability: {len(performance_df[performance_df['coefficient_of_variation'] < 50])}")
 
+text(f"**Data Quality**: {store_manifest['valid_rows']:,} canonical rows after validation, {quarantined_rows:,} quarantined, {merged_rows:,} alias rows merged")
+
+query_cache = get_query_cache()
+text(f"**Result Cache**: {len(query_cache.entries)} entries, {query_cache.hits} hits, {query_cache.misses} misses (TTL {QUERY_CACHE_TTL_SECONDS}s)")
+
 
 
 
@@ -0,0 +1,28 @@
+import time
+
+import numpy as np
+
+from forecasting import forecast_counts
+
+BENCHMARK_LANGUAGES = 50000
+BENCHMARK_QUARTERS = 40
+BENCHMARK_HORIZON = 12
+BENCHMARK_MISSING_FRACTION = 0.05
+
+
+def synthetic_matrix(n_languages, n_quarters, seed=42):
+    rng = np.random.default_rng(seed)
+    matrix = np.abs(np.cumsum(rng.normal(1, 5, (n_languages, n_quarters)), axis=1) + 100)
+    matrix[rng.random(matrix.shape) < BENCHMARK_MISSING_FRACTION] = np.nan
+    return matrix
+
+
+if __name__ == "__main__":
+    matrix = synthetic_matrix(BENCHMARK_LANGUAGES, BENCHMARK_QUARTERS)
+    start = time.perf_counter()
+    forecast_counts(matrix, BENCHMARK_HORIZON)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{BENCHMARK_LANGUAGES:,} languages x {BENCHMARK_QUARTERS} quarters "
+        f"fitted and projected {BENCHMARK_HORIZON} quarters ahead in {elapsed:.2f}s"
+    )
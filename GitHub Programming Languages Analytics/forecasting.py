@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+FORECAST_ALPHAS = (0.2, 0.5, 0.8)
+FORECAST_BETAS = (0.05, 0.2, 0.5)
+FORECAST_DAMPING = 0.9
+FORECAST_INTERVAL_Z = 1.96
+FORECAST_MIN_PERIOD_COVERAGE = 0.5
+FORECAST_PARAMETERS = (
+    FORECAST_ALPHAS, FORECAST_BETAS, FORECAST_DAMPING, FORECAST_INTERVAL_Z, FORECAST_MIN_PERIOD_COVERAGE
+)
+
+
+def build_quarterly_matrix(df, value_col):
+    language_idx, language_names = pd.factorize(df["language"], sort=True)
+    periods = df["year"].to_numpy(dtype=np.int64) * 4 + df["quarter"].to_numpy(dtype=np.int64) - 1
+    first_period = int(periods.min())
+    n_periods = int(periods.max()) - first_period + 1
+    flat_idx = language_idx * n_periods + (periods - first_period)
+    size = len(language_names) * n_periods
+    totals = np.bincount(flat_idx, weights=df[value_col].to_numpy(dtype=float), minlength=size)
+    observed = np.bincount(flat_idx, minlength=size) > 0
+    matrix = np.where(observed, totals, np.nan).reshape(len(language_names), n_periods)
+    return np.asarray(language_names), first_period, matrix
+
+
+def trim_incomplete_periods(matrix, min_coverage=FORECAST_MIN_PERIOD_COVERAGE):
+    totals = np.nansum(matrix, axis=0)
+    n_periods = len(totals)
+    while n_periods > 1 and totals[n_periods - 1] < min_coverage * totals[n_periods - 2]:
+        n_periods -= 1
+    return matrix[:, :n_periods]
+
+
+def last_complete_period(df, value_col, min_coverage=FORECAST_MIN_PERIOD_COVERAGE):
+    _, first_period, matrix = build_quarterly_matrix(df, value_col)
+    return first_period + trim_incomplete_periods(matrix, min_coverage).shape[1] - 1
+
+
+def active_series(matrix):
+    return ~np.isnan(matrix[:, -1])
+
+
+def fit_holt_batch(matrix, horizon, alphas=FORECAST_ALPHAS, betas=FORECAST_BETAS, phi=FORECAST_DAMPING, z=FORECAST_INTERVAL_Z):
+    n_series, n_periods = matrix.shape
+    grid_alpha, grid_beta = [grid.ravel()[:, None] for grid in np.meshgrid(alphas, betas)]
+    observed_matrix = ~np.isnan(matrix)
+    values = np.where(observed_matrix, matrix, 0.0)
+    started = np.zeros(n_series, dtype=bool)
+    level = np.zeros((len(grid_alpha), n_series))
+    trend = np.zeros_like(level)
+    sse = np.zeros_like(level)
+    n_errors = np.zeros(n_series)
+    gain = grid_alpha * grid_beta
+
+    for t in range(n_periods):
+        y = values[:, t]
+        updating = observed_matrix[:, t] & started
+        first_seen = observed_matrix[:, t] & ~started
+        error = (y - level - phi * trend) * updating
+        sse += error * error
+        n_errors += updating
+        level += phi * trend + grid_alpha * error
+        trend = phi * trend + gain * error
+        level[:, first_seen] = y[first_seen]
+        started |= first_seen
+
+    best = sse.argmin(axis=0)
+    series = np.arange(n_series)
+    level, trend = level[best, series], trend[best, series]
+    alpha, beta = grid_alpha[best, 0], grid_beta[best, 0]
+    sigma = np.sqrt(sse[best, series] / np.maximum(n_errors, 1))
+
+    damped_steps = np.cumsum(phi ** np.arange(1, horizon + 1))
+    point = level[:, None] + trend[:, None] * damped_steps
+    psi = alpha[:, None] * (1 + beta[:, None] * damped_steps[:-1])
+    variance_mult = 1 + np.hstack([np.zeros((n_series, 1)), np.cumsum(psi ** 2, axis=1)])
+    half_width = z * sigma[:, None] * np.sqrt(variance_mult)
+    return point, point - half_width, point + half_width
+
+
+def forecast_counts(matrix, horizon):
+    point, lower, upper = fit_holt_batch(np.log1p(matrix), horizon)
+    return np.expm1(point), np.expm1(lower), np.expm1(upper)
+
+
+def period_label(period):
+    return f"{period // 4}-Q{period % 4 + 1}"